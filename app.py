@@ -10,9 +10,11 @@ Security features:
 """
 
 import time
+from collections import deque
+
 import streamlit as st
 
-from query import query
+from query import stream_query
 from embeddings import get_collection_stats
 
 # --- Rate Limiting ---
@@ -25,25 +27,28 @@ def check_rate_limit() -> bool:
     """
     Check if user has exceeded rate limit.
     Returns True if allowed, False if rate limited.
+
+    Timestamps are kept oldest-first in a deque, so expired ones are
+    popped off the left instead of rebuilding the list every call.
     """
     now = time.time()
 
     # Initialize session state
     if "query_timestamps" not in st.session_state:
-        st.session_state.query_timestamps = []
+        st.session_state.query_timestamps = deque()
+
+    timestamps = st.session_state.query_timestamps
 
     # Remove timestamps outside the window
-    st.session_state.query_timestamps = [
-        ts for ts in st.session_state.query_timestamps
-        if now - ts < RATE_LIMIT_WINDOW
-    ]
+    while timestamps and now - timestamps[0] >= RATE_LIMIT_WINDOW:
+        timestamps.popleft()
 
     # Check if under limit
-    if len(st.session_state.query_timestamps) >= RATE_LIMIT_QUERIES:
+    if len(timestamps) >= RATE_LIMIT_QUERIES:
         return False
 
     # Record this query
-    st.session_state.query_timestamps.append(now)
+    timestamps.append(now)
     return True
 
 
@@ -115,29 +120,29 @@ if st.button("Ask", type="primary") or (question and st.session_state.get("last_
         else:
             st.session_state.last_question = question
 
-            with st.spinner("Searching and generating answer..."):
-                try:
-                    answer = query(
+            try:
+                with st.spinner("Searching..."):
+                    answer = stream_query(
                         question=question,
                         top_k=top_k,
                         min_relevance=min_relevance,
                     )
 
-                    # Display answer
-                    st.subheader("Answer")
-                    st.write(answer.answer)
-
-                    # Display sources
-                    if answer.sources:
-                        st.subheader(f"Sources ({answer.context_used} used)")
-                        for i, source in enumerate(answer.sources, 1):
-                            with st.expander(f"{i}. {source.title[:80]}..."):
-                                st.markdown(f"[Read full article]({source.url})")
-                    else:
-                        st.info("No sources met the relevance threshold.")
-
-                except Exception:
-                    st.error("Unable to process your question. Please try again.")
+                # Display answer as it is generated
+                st.subheader("Answer")
+                st.write_stream(answer.chunks)
+
+                # Display sources
+                if answer.sources:
+                    st.subheader(f"Sources ({answer.context_used} used)")
+                    for i, source in enumerate(answer.sources, 1):
+                        with st.expander(f"{i}. {source.title[:80]}..."):
+                            st.markdown(f"[Read full article]({source.url})")
+                else:
+                    st.info("No sources met the relevance threshold.")
+
+            except Exception:
+                st.error("Unable to process your question. Please try again.")
     else:
         st.warning("Please enter a question.")
 
@@ -7,21 +7,78 @@ Key concepts:
 - Vector DB: Store and search embeddings efficiently
 """
 
+import functools
 import hashlib
 import os
+import sqlite3
+import threading
+from array import array
 from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator
 
 import chromadb
-from chromadb.utils import embedding_functions
+import httpx
+import numpy as np
+import tiktoken
 from dotenv import load_dotenv
 from openai import OpenAI
+from tqdm import tqdm
 
 from scraper import Article
 
-load_dotenv()
+try:
+    from numba import njit
+except ImportError:  # Optional - the chunk planner also runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
 
+load_dotenv()
 
-@dataclass
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# text-embedding-3 models can return shortened vectors (native 1536).
+# 512 keeps nearly all retrieval quality with 3x less memory and
+# distance math in the index. The collection name includes it, so
+# changing it starts a new, empty collection - re-ingest afterwards.
+EMBEDDING_DIMENSIONS = 512
+
+# Inputs per embeddings request. The API accepts up to 2048 inputs and
+# ~300k tokens per call; 256 keeps each request well under both.
+EMBED_BATCH_SIZE = 256
+EMBED_BATCH_TOKENS = 250_000
+
+# Records per collection.upsert() call. ChromaDB slows down on one-shot
+# huge upserts; 50-250 keeps each HNSW insert small.
+UPSERT_BATCH_SIZE = 100
+
+# Chunks held in memory at once during ingest. One full embeddings
+# request per batch; peak memory stays flat however big the corpus.
+INGEST_BATCH_SIZE = EMBED_BATCH_SIZE
+
+# Connection pool for OpenAI clients. HTTP/2 multiplexes requests over
+# one connection; keep-alive skips TCP + TLS setup on later calls.
+OPENAI_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20)
+
+# On-disk cache of text -> embedding, shared across runs
+EMBED_CACHE_PATH = "./embed_cache.sqlite"
+
+# Collection settings. OpenAI embeddings are unit length, so cosine is
+# the natural metric. HNSW params trade build time for recall: M is
+# links per node, construction_ef/search_ef are candidate list sizes.
+# These only apply when the collection is created - delete chroma_db/
+# and re-ingest to change them.
+COLLECTION_NAME = f"sports_news_{EMBEDDING_DIMENSIONS}"
+COLLECTION_METADATA = {
+    "description": "Sports news articles for RAG",
+    "hnsw:space": "cosine",
+    "hnsw:M": 24,
+    "hnsw:construction_ef": 128,
+    "hnsw:search_ef": 100,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Chunk:
     """A piece of an article with metadata for citations."""
     text: str
@@ -33,7 +90,36 @@ class Chunk:
 
 # --- Chunking ---
 
-def chunk_text(text: str, chunk_size: int = 500, overlap: int = 50) -> list[str]:
+def find_sentence_breaks(text: str) -> np.ndarray:
+    """
+    Find every position just after a sentence or paragraph end.
+
+    Recognized ends are ". ", "! ", "? " and "\n\n"; positions point
+    just past the punctuation (or first newline). These are the
+    candidate places to end a chunk. All patterns are matched in one
+    vectorized pass over the code points instead of a str.rfind()
+    call per chunk. UTF-32 gives one array element per character, so
+    positions index text.
+    """
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    first, second = codes[:-1], codes[1:]
+
+    sentence_end = (
+        ((first == ord(".")) | (first == ord("!")) | (first == ord("?")))
+        & (second == ord(" "))
+    )
+    paragraph_end = (first == ord("\n")) & (second == ord("\n"))
+
+    return np.flatnonzero(sentence_end | paragraph_end) + 1
+
+
+@functools.lru_cache(maxsize=1)
+def get_tokenizer() -> tiktoken.Encoding:
+    """The embedding model's tokenizer (loaded once)."""
+    return tiktoken.encoding_for_model(EMBEDDING_MODEL)
+
+
+def chunk_text(text: str, chunk_size: int = 256, overlap: int = 32) -> list[str]:
     """
     Split text into overlapping chunks.
 
@@ -43,36 +129,89 @@ def chunk_text(text: str, chunk_size: int = 500, overlap: int = 50) -> list[str]
     - Overlap prevents losing context at boundaries
 
     Args:
-        chunk_size: Target characters per chunk (~100 tokens)
-        overlap: Characters to repeat between chunks
+        chunk_size: Target tokens per chunk
+        overlap: Tokens to repeat between chunks
 
-    This is a simple character-based chunker. Production systems
-    might use token-based or semantic chunking.
+    Sizes are counted in the embedding model's own tokens, so every
+    chunk costs about the same to embed and none can overrun the
+    model's input limit. Chunks still prefer to end at a sentence or
+    paragraph break within the last ~25 tokens.
     """
-    if len(text) <= chunk_size:
+    encoding = get_tokenizer()
+    # Scraped text is untrusted; "<|endoftext|>" in an article is just
+    # text, not a reason to fail the ingest
+    tokens = encoding.encode(text, disallowed_special=())
+
+    if len(tokens) <= chunk_size:
         return [text]
 
-    chunks = []
+    # offsets[i] is the character where token i starts
+    decoded, offsets = encoding.decode_with_offsets(tokens)
+    offsets = np.asarray(offsets, dtype=np.int64)
+
+    # Sentence breaks in token positions: the token starting at the break
+    breaks = np.unique(np.searchsorted(offsets, find_sentence_breaks(decoded)))
+    spans = plan_chunks(breaks, len(tokens), chunk_size, overlap, 25)
+
+    # Back to characters, so chunks are slices of the original text
+    char_bounds = np.append(offsets, len(decoded))
+    return [
+        decoded[char_bounds[start]:char_bounds[end]].strip()
+        for start, end in spans.tolist()
+    ]
+
+
+@njit(cache=True)
+def plan_chunks(
+    breaks: np.ndarray,
+    length: int,
+    chunk_size: int,
+    overlap: int,
+    lookback: int,
+) -> np.ndarray:
+    """
+    Compute (start, end) offsets for every chunk of a sequence.
+
+    breaks are the sorted candidate split points (sentence ends), and
+    a chunk is cut short at the latest one within its last lookback
+    positions. Chunk ends only move forward, so a single
+    pointer walks breaks once for the whole text. Compiled with Numba
+    when it's installed; long articles are where that pays off.
+    """
+    spans = np.empty((16, 2), dtype=np.int64)
+    n = 0
+    j = -1  # Index of the latest break that fits the current chunk
     start = 0
 
-    while start < len(text):
-        end = start + chunk_size
+    while start < length:
+        end = min(start + chunk_size, length)
 
         # Try to break at sentence boundary
-        if end < len(text):
-            # Look for sentence end within last 100 chars of chunk
-            search_start = max(end - 100, start)
-            last_period = text.rfind(". ", search_start, end)
-            if last_period > start:
-                end = last_period + 1
-
-        chunks.append(text[start:end].strip())
+        if end < length:
+            # Latest sentence end that fits in the chunk...
+            while j + 1 < len(breaks) and breaks[j + 1] <= end - 1:
+                j += 1
+            # ...as long as it's near the end of the chunk
+            search_start = max(end - lookback, start)
+            if j >= 0 and breaks[j] > search_start and breaks[j] > start + 1:
+                end = breaks[j]
+
+        if n == spans.shape[0]:
+            grown = np.empty((2 * n, 2), dtype=np.int64)
+            grown[:n] = spans
+            spans = grown
+        spans[n, 0] = start
+        spans[n, 1] = end
+        n += 1
+
+        if end == length:
+            break
         start = end - overlap
 
-    return chunks
+    return spans[:n]
 
 
-def chunk_article(article: Article, chunk_size: int = 500, overlap: int = 50) -> list[Chunk]:
+def chunk_article(article: Article, chunk_size: int = 256, overlap: int = 32) -> list[Chunk]:
     """
     Convert an article into chunks with metadata.
 
@@ -95,39 +234,195 @@ def chunk_article(article: Article, chunk_size: int = 500, overlap: int = 50) ->
 
 # --- Embeddings ---
 
+_openai_client: OpenAI | None = None
+_openai_client_lock = threading.Lock()
+
+
 def get_openai_client() -> OpenAI:
-    """Get OpenAI client, checking for API key."""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY not found. Copy .env.example to .env and add your key.")
-    return OpenAI(api_key=api_key)
+    """
+    Get the shared OpenAI client, checking for API key.
+
+    One client per process keeps its connections open, so only the
+    first request pays for the TLS handshake.
+    """
+    global _openai_client
+    with _openai_client_lock:
+        if _openai_client is None:
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise ValueError("OPENAI_API_KEY not found. Copy .env.example to .env and add your key.")
+            _openai_client = OpenAI(
+                api_key=api_key,
+                http_client=httpx.Client(http2=True, limits=OPENAI_HTTP_LIMITS),
+            )
+    return _openai_client
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English)."""
+    return len(text) // 4 + 1
+
+
+def batch_texts(
+    texts: list[str],
+    max_items: int = EMBED_BATCH_SIZE,
+    max_tokens: int = EMBED_BATCH_TOKENS,
+) -> Iterator[list[str]]:
+    """
+    Pack texts into request-sized batches.
+
+    A batch closes when it reaches max_items inputs or adding the next
+    text would push it over max_tokens (estimated).
+    """
+    batch: list[str] = []
+    batch_tokens = 0
+
+    for text in texts:
+        tokens = estimate_tokens(text)
+        if batch and (len(batch) >= max_items or batch_tokens + tokens > max_tokens):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(text)
+        batch_tokens += tokens
+
+    if batch:
+        yield batch
+
+
+# --- Embedding Cache ---
 
+_embed_cache: sqlite3.Connection | None = None
+_embed_cache_lock = threading.Lock()
 
-def embed_texts(texts: list[str], model: str = "text-embedding-3-small") -> list[list[float]]:
+
+def get_embed_cache() -> sqlite3.Connection:
+    """
+    Open the on-disk embedding cache (once per process).
+
+    Embeddings are deterministic for a given model and text, so a
+    local lookup (~microseconds) can replace a paid API round trip
+    (~100ms). Vectors are stored as float32 blobs.
+    """
+    global _embed_cache
+    with _embed_cache_lock:
+        if _embed_cache is None:
+            conn = sqlite3.connect(EMBED_CACHE_PATH, check_same_thread=False)
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    PRIMARY KEY (key, model)
+                )"""
+            )
+            conn.commit()
+            _embed_cache = conn
+    return _embed_cache
+
+
+def text_key(text: str) -> str:
+    """Cache key for a text."""
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def get_cached_embeddings(keys: list[str], model: str) -> dict[str, list[float]]:
+    """Look up cached embeddings, returning only the keys that were found."""
+    conn = get_embed_cache()
+    found = {}
+
+    with _embed_cache_lock:
+        # Stay well under SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            batch = keys[i:i + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT key, embedding FROM embeddings WHERE model = ? AND key IN ({placeholders})",
+                [model, *batch],
+            )
+            for key, blob in rows:
+                found[key] = array("f", blob).tolist()
+
+    return found
+
+
+def cache_embeddings(embeddings: dict[str, list[float]], model: str) -> None:
+    """Write freshly computed embeddings to the cache."""
+    conn = get_embed_cache()
+    with _embed_cache_lock, conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, model, embedding) VALUES (?, ?, ?)",
+            [(key, model, array("f", emb).tobytes()) for key, emb in embeddings.items()],
+        )
+
+
+def request_embeddings(texts: list[str], model: str, dimensions: int) -> list[list[float]]:
+    """Embed texts with the API, one request per batch (see batch_texts)."""
+    client = get_openai_client()
+
+    embeddings = []
+    for batch in batch_texts(texts):
+        response = client.embeddings.create(
+            model=model,
+            input=batch,
+            dimensions=dimensions,
+        )
+        embeddings.extend(item.embedding for item in response.data)
+    return embeddings
+
+
+def embed_texts(
+    texts: list[str],
+    model: str = EMBEDDING_MODEL,
+    dimensions: int = EMBEDDING_DIMENSIONS,
+    cache: bool = True,
+) -> list[list[float]]:
     """
     Generate embeddings for a list of texts.
 
     text-embedding-3-small:
-    - 1536 dimensions
+    - 1536 dimensions, shortened to `dimensions` by the API
     - Good balance of quality and cost
     - ~$0.02 per 1M tokens
 
     Batching is important - API calls have overhead, so we
-    embed multiple texts in one request.
+    embed many texts per request (see batch_texts) instead of
+    one request per chunk.
+
+    Texts seen before (by content hash) are served from the on-disk
+    cache; only the rest go to the API. Results keep input order.
+    Pass cache=False for one-off texts such as user questions, which
+    would only grow the cache.
     """
-    client = get_openai_client()
+    if not texts:
+        return []
 
-    response = client.embeddings.create(
-        model=model,
-        input=texts,
-    )
+    if not cache:
+        return request_embeddings(texts, model, dimensions)
+
+    keys = [text_key(t) for t in texts]
+    # Vectors of different sizes must not share cache entries
+    cache_model = f"{model}:{dimensions}"
+    embeddings = get_cached_embeddings(list(set(keys)), cache_model)
+
+    # Unique uncached texts, in first-seen order
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in embeddings:
+            missing.setdefault(key, text)
+
+    if missing:
+        fresh = request_embeddings(list(missing.values()), model, dimensions)
+        fresh_by_key = dict(zip(missing, fresh))
+        cache_embeddings(fresh_by_key, cache_model)
+        embeddings.update(fresh_by_key)
 
-    return [item.embedding for item in response.data]
+    return [embeddings[key] for key in keys]
 
 
 # --- Vector Storage (ChromaDB) ---
 
-def get_chroma_collection(collection_name: str = "sports_news"):
+@functools.lru_cache(maxsize=4)
+def get_chroma_collection(collection_name: str = COLLECTION_NAME):
     """
     Get or create a ChromaDB collection.
 
@@ -136,24 +431,42 @@ def get_chroma_collection(collection_name: str = "sports_news"):
     - Persists to disk in chroma_db/ folder
     - Handles embedding storage and similarity search
 
-    We use OpenAI's embedding function directly in ChromaDB,
-    so it auto-embeds on add() and query().
+    We compute embeddings ourselves with embed_texts (batched) and
+    pass them in on upsert() and query(), so the collection has no
+    embedding function of its own.
+
+    Distances are cosine (see COLLECTION_METADATA). Vectors must have
+    EMBEDDING_DIMENSIONS entries; a collection holding vectors of
+    another size (e.g. one built before the switch to 512) raises
+    ValueError here instead of failing on every query.
+
+    Opening the client loads the index from disk, so the collection is
+    cached per name and reused by every search and ingest.
     """
     # Persist to local directory
     client = chromadb.PersistentClient(path="./chroma_db")
 
-    # Use OpenAI embeddings via ChromaDB's built-in function
-    openai_ef = embedding_functions.OpenAIEmbeddingFunction(
-        api_key=os.getenv("OPENAI_API_KEY"),
-        model_name="text-embedding-3-small"
-    )
-
     collection = client.get_or_create_collection(
         name=collection_name,
-        embedding_function=openai_ef,
-        metadata={"description": "Sports news articles for RAG"}
+        embedding_function=None,
+        metadata=COLLECTION_METADATA,
     )
 
+    # get_or_create keeps an existing collection's original settings
+    if (collection.metadata or {}).get("hnsw:space") != "cosine":
+        print(
+            f"Warning: collection '{collection_name}' does not use cosine distance; "
+            "delete chroma_db/ and re-ingest so relevance scores are calibrated"
+        )
+
+    sample = collection.get(limit=1, include=["embeddings"])["embeddings"]
+    if sample is not None and len(sample) and len(sample[0]) != EMBEDDING_DIMENSIONS:
+        raise ValueError(
+            f"Collection '{collection_name}' holds {len(sample[0])}-dimension vectors "
+            f"but EMBEDDING_DIMENSIONS is {EMBEDDING_DIMENSIONS}; "
+            "delete chroma_db/ and re-ingest"
+        )
+
     return collection
 
 
@@ -164,57 +477,110 @@ def generate_chunk_id(chunk: Chunk) -> str:
     Using a hash ensures:
     - Same content = same ID (deduplication)
     - No collisions between different chunks
+
+    BLAKE2b (stdlib) is faster than MD5 in software; a 16-byte digest
+    keeps IDs the same length as before.
     """
-    content = f"{chunk.article_url}:{chunk.chunk_index}:{chunk.text[:100]}"
-    return hashlib.md5(content.encode()).hexdigest()
+    content = b"%s:%d:%s" % (
+        chunk.article_url.encode(),
+        chunk.chunk_index,
+        chunk.text[:100].encode(),
+    )
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
 
 
 # --- Ingest Pipeline ---
 
-def ingest_articles(articles: list[Article], chunk_size: int = 500) -> int:
+def iter_chunks(articles: Iterable[Article], chunk_size: int = 256) -> Iterator[Chunk]:
+    """Chunk articles lazily, one article at a time."""
+    for article in articles:
+        yield from chunk_article(article, chunk_size=chunk_size)
+
+
+def ingest_articles(articles: list[Article], chunk_size: int = 256) -> int:
     """
     Process articles and store in vector database.
 
-    Pipeline:
-    1. Chunk each article
-    2. Prepare metadata for citations
-    3. Add to ChromaDB (auto-embeds)
+    Pipeline, per batch of INGEST_BATCH_SIZE chunks:
+    1. Chunk articles (lazily, see iter_chunks)
+    2. Drop chunks already in the collection
+    3. Prepare metadata for citations
+    4. Embed new chunks
+    5. Add to ChromaDB with precomputed embeddings
 
-    Returns number of chunks added.
+    Only one batch of chunks, texts and vectors is alive at a time, so
+    memory doesn't grow with the size of the ingest.
+
+    Returns number of new chunks added.
     """
     collection = get_chroma_collection()
-
-    all_chunks = []
-    for article in articles:
-        chunks = chunk_article(article, chunk_size=chunk_size)
-        all_chunks.extend(chunks)
-
-    if not all_chunks:
+    chunks = iter_chunks(articles, chunk_size=chunk_size)
+
+    total = added = already_stored = 0
+
+    with tqdm(desc="Ingesting", unit="chunk") as progress:
+        while batch := list(islice(chunks, INGEST_BATCH_SIZE)):
+            progress.update(len(batch))
+
+            # Skip chunks that are already stored. IDs are content hashes,
+            # so a known ID means the chunk is unchanged and needs no new
+            # embedding. Duplicates within the batch collapse in the dict;
+            # duplicates of earlier batches (the same story often appears
+            # in several feeds) were upserted already, so the lookup
+            # below finds them.
+            chunks_by_id = {generate_chunk_id(c): c for c in batch}
+            total += len(chunks_by_id)
+
+            existing = set(collection.get(ids=list(chunks_by_id), include=[])["ids"])
+            already_stored += len(existing)
+            new_chunks = {
+                chunk_id: c for chunk_id, c in chunks_by_id.items()
+                if chunk_id not in existing
+            }
+
+            if not new_chunks:
+                continue
+
+            # Prepare data for ChromaDB
+            ids = list(new_chunks)
+            documents = [c.text for c in new_chunks.values()]
+            metadatas = [
+                {
+                    "title": c.article_title,
+                    "url": c.article_url,
+                    "source": c.source,
+                    "chunk_index": c.chunk_index,
+                }
+                for c in new_chunks.values()
+            ]
+
+            embeddings = embed_texts(documents)
+
+            # Upsert in batches to handle duplicates gracefully without
+            # handing ChromaDB a large insert at once
+            for i in range(0, len(ids), UPSERT_BATCH_SIZE):
+                collection.upsert(
+                    ids=ids[i:i + UPSERT_BATCH_SIZE],
+                    documents=documents[i:i + UPSERT_BATCH_SIZE],
+                    metadatas=metadatas[i:i + UPSERT_BATCH_SIZE],
+                    embeddings=embeddings[i:i + UPSERT_BATCH_SIZE],
+                )
+
+            added += len(ids)
+
+    if not total:
         print("No chunks to ingest")
         return 0
 
-    # Prepare data for ChromaDB
-    ids = [generate_chunk_id(c) for c in all_chunks]
-    documents = [c.text for c in all_chunks]
-    metadatas = [
-        {
-            "title": c.article_title,
-            "url": c.article_url,
-            "source": c.source,
-            "chunk_index": c.chunk_index,
-        }
-        for c in all_chunks
-    ]
+    if not added:
+        print(f"All {total} chunks already ingested")
+        return 0
 
-    # Upsert to handle duplicates gracefully
-    collection.upsert(
-        ids=ids,
-        documents=documents,
-        metadatas=metadatas,
+    print(
+        f"Ingested {added} new chunks from {len(articles)} articles "
+        f"({already_stored} already stored)"
     )
-
-    print(f"Ingested {len(all_chunks)} chunks from {len(articles)} articles")
-    return len(all_chunks)
+    return added
 
 
 def get_collection_stats() -> dict:
@@ -228,8 +594,14 @@ def get_collection_stats() -> dict:
 
 # CLI for testing
 if __name__ == "__main__":
+    import logging
+
     from scraper import scrape_feed
 
+    # Show the scraper's per-feed progress
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
     print("=== Embeddings Pipeline Test ===\n")
 
     # Check for API key
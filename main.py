@@ -8,21 +8,24 @@ Security features:
 - Sanitized error messages
 """
 
+import asyncio
+import json
 import os
 from functools import wraps
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request, Security, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.security import APIKeyHeader
 from pydantic import BaseModel, Field
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
-from query import query, Answer
-from retriever import search, SearchResult
-from embeddings import get_collection_stats
+from query import query_async, query_stream, Answer, StreamingAnswer
+from retriever import search_many, SearchResults
+from embeddings import get_chroma_collection, get_collection_stats
 
 load_dotenv()
 
@@ -38,6 +41,9 @@ ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:8501").split(",
 # Rate limiting
 RATE_LIMIT = os.getenv("RATE_LIMIT", "10/minute")  # Requests per minute
 
+# How long /search waits to batch concurrent requests together (seconds)
+SEARCH_BATCH_WINDOW = float(os.getenv("SEARCH_BATCH_WINDOW", "0.01"))
+
 
 # --- App Setup ---
 
@@ -62,6 +68,12 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+def load_collection():
+    """Open the vector database once, before the first request."""
+    get_chroma_collection()
+
+
 # --- Authentication ---
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
@@ -93,6 +105,7 @@ class QueryRequest(BaseModel):
     question: str = Field(..., min_length=3, max_length=500, description="Question to answer")
     top_k: int = Field(default=5, ge=1, le=20, description="Max chunks to retrieve")
     min_relevance: float = Field(default=0.3, ge=0, le=1, description="Minimum relevance threshold")
+    stream: bool = Field(default=False, description="Stream the answer as Server-Sent Events")
 
 
 class SourceResponse(BaseModel):
@@ -130,6 +143,87 @@ class SearchResponse(BaseModel):
     results: list[SearchResultResponse]
 
 
+# --- Streaming ---
+
+def sse_event(event: str, data) -> str:
+    """Format one Server-Sent Event. Data is JSON so newlines stay escaped."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_answer_events(answer: StreamingAnswer):
+    """
+    Stream an answer as SSE: one "sources" event, then a "token" event
+    per piece of answer text, then "done" (or "error").
+    """
+    yield sse_event("sources", {
+        "question": answer.question,
+        "sources": [{"title": s.title, "url": s.url} for s in answer.sources],
+        "context_used": answer.context_used,
+    })
+
+    try:
+        async for text in answer.chunks:
+            yield sse_event("token", text)
+    except Exception:
+        # Headers are already sent, so report failure in-band
+        yield sse_event("error", "Query processing failed")
+        return
+
+    yield sse_event("done", None)
+
+
+# --- Search Batching ---
+
+class SearchBatcher:
+    """
+    Coalesce concurrent /search requests into one search_many() call.
+
+    The first request for a given top_k opens a short window; every
+    request arriving in that window joins the batch, and the whole
+    batch is embedded and searched together.
+    """
+
+    def __init__(self, window: float = SEARCH_BATCH_WINDOW):
+        self.window = window
+        self._pending: dict[int, list[tuple[str, asyncio.Future]]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def search(self, query: str, top_k: int) -> SearchResults:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.setdefault(top_k, [])
+        batch.append((query, future))
+        if len(batch) == 1:
+            task = loop.create_task(self._flush(top_k))
+            self._tasks.add(task)  # Keep a reference until it finishes
+            task.add_done_callback(self._tasks.discard)
+
+        return await future
+
+    async def _flush(self, top_k: int) -> None:
+        await asyncio.sleep(self.window)
+        batch = self._pending.pop(top_k)
+
+        try:
+            # search_many() blocks on ChromaDB, so keep it off the event loop
+            results = await asyncio.to_thread(
+                search_many, [query for query, _ in batch], top_k
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():  # Caller may have gone away
+                future.set_result(result)
+
+
+search_batcher = SearchBatcher()
+
+
 # --- Endpoints ---
 
 @app.get("/health")
@@ -150,7 +244,7 @@ def get_stats(authorized: bool = Depends(verify_api_key)):
 
 @app.post("/query", response_model=QueryResponse)
 @limiter.limit(RATE_LIMIT)
-def query_endpoint(
+async def query_endpoint(
     request: QueryRequest,
     req: Request,  # Required for rate limiter
     authorized: bool = Depends(verify_api_key),
@@ -161,10 +255,24 @@ def query_endpoint(
     Retrieves relevant chunks from the vector database,
     then uses GPT-4o-mini to generate an answer with citations.
 
+    With "stream": true the answer is sent as Server-Sent Events
+    (see stream_answer_events) instead of one JSON response.
+
     Rate limited to prevent abuse.
     """
     try:
-        answer: Answer = query(
+        if request.stream:
+            streaming = await query_stream(
+                question=request.question,
+                top_k=request.top_k,
+                min_relevance=request.min_relevance,
+            )
+            return StreamingResponse(
+                stream_answer_events(streaming),
+                media_type="text/event-stream",
+            )
+
+        answer: Answer = await query_async(
             question=request.question,
             top_k=request.top_k,
             min_relevance=request.min_relevance,
@@ -185,7 +293,7 @@ def query_endpoint(
 
 @app.post("/search", response_model=SearchResponse)
 @limiter.limit(RATE_LIMIT)
-def search_endpoint(
+async def search_endpoint(
     request: SearchRequest,
     req: Request,  # Required for rate limiter
     authorized: bool = Depends(verify_api_key),
@@ -194,11 +302,12 @@ def search_endpoint(
     Search for relevant chunks without LLM generation.
 
     Useful for debugging retrieval or building custom UIs.
+    Concurrent requests are batched (see SearchBatcher).
 
     Rate limited to prevent abuse.
     """
     try:
-        results: list[SearchResult] = search(
+        results: SearchResults = await search_batcher.search(
             query=request.query,
             top_k=request.top_k,
         )
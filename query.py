@@ -7,25 +7,38 @@ Key concepts:
 - Grounded generation: Answer based on retrieved facts, not hallucination
 """
 
+import asyncio
 import os
-from dataclasses import dataclass
-
+import threading
+import time
+import weakref
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Awaitable, Iterator, TypeVar
+
+import httpx
+import numpy as np
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAIError
 
+from embeddings import OPENAI_HTTP_LIMITS, embed_texts
 from retriever import search, SearchResult
 
 load_dotenv()
 
+LLM_MODEL = "gpt-4o-mini"
 
-@dataclass
+T = TypeVar("T")
+
+
+@dataclass(slots=True, frozen=True)
 class Source:
     """A cited source for the answer."""
     title: str
     url: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Answer:
     """RAG response with answer and citations."""
     question: str
@@ -34,6 +47,123 @@ class Answer:
     context_used: int  # Number of chunks used
 
 
+@dataclass
+class StreamingAnswer:
+    """RAG response whose answer text arrives while it is generated."""
+    question: str
+    sources: list[Source]
+    context_used: int  # Number of chunks used
+    chunks: AsyncIterator[str] | Iterator[str]  # Answer text, piece by piece
+
+
+class SemanticCache:
+    """
+    Cache answers by question meaning, not exact wording.
+
+    "Who won the Super Bowl?" and "Who won the Superbowl??" embed to
+    nearly the same vector, so the second can reuse the first answer
+    without retrieval or an LLM call.
+
+    Lookup uses random-projection LSH: each question vector is hashed
+    by which side of a few random hyperplanes it falls on. Similar
+    vectors usually land in the same bucket, so we only compare
+    against a handful of candidates. A single long signature splits
+    close neighbours too often, so we use several short tables and
+    check every bucket the question lands in.
+
+    Entries expire after ttl seconds (news goes stale) and the least
+    recently used are evicted beyond max_entries.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        num_tables: int = 4,
+        num_planes: int = 8,
+        max_entries: int = 256,
+        ttl: float = 600,
+        seed: int = 0,
+    ):
+        self.threshold = threshold
+        self.num_tables = num_tables
+        self.num_planes = num_planes
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._rng = np.random.default_rng(seed)
+        self._planes: np.ndarray | None = None  # Created once we know the dimension
+        self._bit_weights = 1 << np.arange(num_planes)
+        self._entries: OrderedDict[int, tuple] = OrderedDict()
+        self._buckets: defaultdict[tuple, set[int]] = defaultdict(set)
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _signatures(self, vector: np.ndarray, scope: tuple) -> list[tuple]:
+        """One bucket key per table."""
+        if self._planes is None:
+            self._planes = self._rng.standard_normal(
+                (self.num_tables, self.num_planes, vector.shape[0])
+            )
+        bits = (self._planes @ vector) > 0
+        codes = bits @ self._bit_weights
+        return [(table, int(code), scope) for table, code in enumerate(codes)]
+
+    def _remove(self, entry_id: int) -> None:
+        signatures, _, _, _ = self._entries.pop(entry_id)
+        for signature in signatures:
+            self._buckets[signature].discard(entry_id)
+            if not self._buckets[signature]:
+                del self._buckets[signature]
+
+    def get(self, embedding: list[float], scope: tuple = ()) -> Answer | None:
+        """Return a cached answer for a near-identical question, if any."""
+        vector = np.asarray(embedding)
+        vector = vector / np.linalg.norm(vector)
+        now = time.monotonic()
+
+        with self._lock:
+            candidates = set()
+            for signature in self._signatures(vector, scope):
+                candidates |= self._buckets.get(signature, set())
+
+            best_id, best_score = None, self.threshold
+            for entry_id in candidates:
+                _, cached_vector, _, created = self._entries[entry_id]
+                if now - created > self.ttl:
+                    self._remove(entry_id)
+                    continue
+                score = float(cached_vector @ vector)
+                if score >= best_score:
+                    best_id, best_score = entry_id, score
+
+            if best_id is None:
+                return None
+
+            self._entries.move_to_end(best_id)
+            return self._entries[best_id][2]
+
+    def put(self, embedding: list[float], answer: Answer, scope: tuple = ()) -> None:
+        """Store an answer under its question embedding."""
+        vector = np.asarray(embedding)
+        vector = vector / np.linalg.norm(vector)
+
+        with self._lock:
+            signatures = self._signatures(vector, scope)
+            entry_id = self._next_id
+            self._next_id += 1
+
+            self._entries[entry_id] = (signatures, vector, answer, time.monotonic())
+            for signature in signatures:
+                self._buckets[signature].add(entry_id)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+
+# Shared across calls so repeated questions skip retrieval + LLM
+answer_cache = SemanticCache()
+
+
 # System prompt instructs the LLM how to behave
 SYSTEM_PROMPT = """You are a sports news assistant. Answer questions based ONLY on the provided context.
 
@@ -61,16 +191,123 @@ def build_context(results: list[SearchResult]) -> str:
     return "\n---\n".join(context_parts)
 
 
-def query(question: str, top_k: int = 5, min_relevance: float = 0.3) -> Answer:
+def build_messages(context: str, question: str) -> list[dict]:
+    """
+    Build the chat messages for the LLM.
+
+    OpenAI caches the longest previously seen prompt prefix (for
+    prompts over 1024 tokens) and skips recomputing it. Everything
+    that repeats between calls - the system prompt, then the context
+    block - comes first, and the question goes in its own final
+    message so it never breaks the shared prefix.
+    """
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": f"Context:\n{context}"},
+        {
+            "role": "user",
+            "content": f"Question: {question}\n\n"
+                       "Answer the question based on the context above. Cite your sources.",
+        },
+    ]
+
+
+# --- OpenAI Client ---
+
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    Get the shared AsyncOpenAI client for the running event loop.
+
+    Reusing the client keeps its HTTP/2 connection open between
+    queries. Async connections belong to the loop that opened them, so
+    there is one client per loop - in practice the FastAPI loop and
+    the background loop behind run_sync.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=httpx.AsyncClient(http2=True, limits=OPENAI_HTTP_LIMITS),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+_sync_loop: asyncio.AbstractEventLoop | None = None
+_sync_loop_lock = threading.Lock()
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """
+    Wait for an awaitable from blocking code (Streamlit, the CLI).
+
+    Everything runs on one long-lived background event loop, so the
+    loop's OpenAI client and connections survive between calls instead
+    of being torn down with a per-call loop.
+    """
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(target=_sync_loop.run_forever, name="query-loop", daemon=True).start()
+
+    async def wait():
+        return await awaitable
+
+    return asyncio.run_coroutine_threadsafe(wait(), _sync_loop).result()
+
+
+# Event loops whose client has already opened its connection
+_warmed_loops: weakref.WeakSet = weakref.WeakSet()
+
+
+async def warm_up(client: AsyncOpenAI) -> None:
     """
-    Answer a question using RAG.
+    Open the HTTPS connection to the API before the LLM call needs it.
+
+    A cheap metadata request pays for DNS + TCP + TLS while retrieval
+    is still running; the chat request then reuses the connection.
+    The client (and its connection) lives as long as its event loop,
+    so this only sends a request the first time per loop.
+    """
+    loop = asyncio.get_running_loop()
+    if loop in _warmed_loops:
+        return
+    _warmed_loops.add(loop)
+
+    try:
+        await client.models.retrieve(LLM_MODEL)
+    except OpenAIError:
+        pass  # Not fatal - the chat request reports any real problem
+
+
+async def query_stream(
+    question: str,
+    top_k: int = 5,
+    min_relevance: float = 0.3,
+) -> StreamingAnswer:
+    """
+    Answer a question using RAG, streaming the answer text.
 
     Pipeline:
+    0. Return a cached answer if a near-identical question was seen
     1. Retrieve relevant chunks from vector database
+       (while the LLM connection warms up)
     2. Filter by relevance threshold
     3. Build context from chunks
-    4. Call LLM with context + question
-    5. Return answer with source citations
+    4. Call LLM with context + question, streaming tokens
+    5. Cache the full answer once the stream is done
+
+    Sources are known as soon as this returns; the answer text is
+    yielded by .chunks as the LLM produces it, so the first words show
+    up long before the last ones are generated.
+
+    Retrieval is blocking (ChromaDB + embeddings client), so it runs in
+    a worker thread; the event loop stays free for other requests.
 
     Args:
         question: User's natural language question
@@ -78,54 +315,132 @@ def query(question: str, top_k: int = 5, min_relevance: float = 0.3) -> Answer:
         min_relevance: Minimum relevance score (0-1)
 
     Returns:
-        Answer object with response and cited sources
+        StreamingAnswer with cited sources and an answer-text stream
     """
-    # Step 1: Retrieve relevant chunks
-    results = search(question, top_k=top_k)
+    # Step 0: Check the semantic cache. The question embedding is
+    # handed to search() below, so the question is embedded only once.
+    question_embedding = (await asyncio.to_thread(embed_texts, [question], cache=False))[0]
+    cache_scope = (top_k, min_relevance)
+    cached = answer_cache.get(question_embedding, scope=cache_scope)
+    if cached is not None:
+        async def cached_chunks() -> AsyncIterator[str]:
+            yield cached.answer
+
+        return StreamingAnswer(
+            question=question,
+            sources=cached.sources,
+            context_used=cached.context_used,
+            chunks=cached_chunks(),
+        )
+
+    client = get_async_openai_client()
+
+    # Step 1: Retrieve relevant chunks, overlapped with connection setup
+    results, _ = await asyncio.gather(
+        asyncio.to_thread(search, question, top_k, question_embedding),
+        warm_up(client),
+    )
+
+    # Step 2: Filter by relevance (sources stay in relevance order)
+    relevant_results = results.filter(min_relevance)
 
-    # Step 2: Filter by relevance
-    relevant_results = [r for r in results if r.relevance_score >= min_relevance]
+    sources = [
+        Source(title=r.title, url=r.url)
+        for r in relevant_results
+    ]
 
-    # Step 3: Build context
-    context = build_context(relevant_results)
+    # Step 3: Build context. Sorting by chunk ID gives the same chunks
+    # the same order on every call (see build_messages).
+    context = build_context(sorted(relevant_results, key=lambda r: r.chunk_id))
 
     # Step 4: Build the prompt
-    user_prompt = f"""Context:
-{context}
+    messages = build_messages(context, question)
+
+    async def generate() -> AsyncIterator[str]:
+        parts = []
+
+        # Step 5: Call LLM, forwarding text as it arrives
+        stream = await client.chat.completions.create(
+            model=LLM_MODEL,
+            messages=messages,
+            temperature=0.3,  # Lower = more factual, less creative
+            max_tokens=500,
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                text = chunk.choices[0].delta.content
+                parts.append(text)
+                yield text
+
+        # Step 6: Cache the complete answer
+        answer_cache.put(
+            question_embedding,
+            Answer(
+                question=question,
+                answer="".join(parts),
+                sources=sources,
+                context_used=len(relevant_results),
+            ),
+            scope=cache_scope,
+        )
+
+    return StreamingAnswer(
+        question=question,
+        sources=sources,
+        context_used=len(relevant_results),
+        chunks=generate(),
+    )
 
-Question: {question}
 
-Answer the question based on the context above. Cite your sources."""
+def stream_query(question: str, top_k: int = 5, min_relevance: float = 0.3) -> StreamingAnswer:
+    """
+    Blocking version of query_stream, for callers without an event loop
+    (Streamlit). .chunks is a plain iterator.
+    """
+    streaming = run_sync(query_stream(question, top_k=top_k, min_relevance=min_relevance))
 
-    # Step 5: Call LLM
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    def chunks() -> Iterator[str]:
+        try:
+            while True:
+                try:
+                    yield run_sync(anext(streaming.chunks))
+                except StopAsyncIteration:
+                    return
+        finally:
+            run_sync(streaming.chunks.aclose())
 
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
-        temperature=0.3,  # Lower = more factual, less creative
-        max_tokens=500,
-    )
+    return replace(streaming, chunks=chunks())
 
-    answer_text = response.choices[0].message.content
 
-    # Step 6: Build response with sources
-    sources = [
-        Source(title=r.title, url=r.url)
-        for r in relevant_results
-    ]
+async def query_async(question: str, top_k: int = 5, min_relevance: float = 0.3) -> Answer:
+    """
+    Answer a question using RAG, returning the complete answer.
+
+    Same pipeline as query_stream; the answer text is collected before
+    returning.
+    """
+    streaming = await query_stream(question, top_k=top_k, min_relevance=min_relevance)
+    answer_text = "".join([text async for text in streaming.chunks])
 
     return Answer(
         question=question,
         answer=answer_text,
-        sources=sources,
-        context_used=len(relevant_results),
+        sources=streaming.sources,
+        context_used=streaming.context_used,
     )
 
 
+def query(question: str, top_k: int = 5, min_relevance: float = 0.3) -> Answer:
+    """
+    Answer a question using RAG (blocking).
+
+    Runs query_async via run_sync, for callers without an event loop
+    (the CLI).
+    """
+    return run_sync(query_async(question, top_k=top_k, min_relevance=min_relevance))
+
+
 def format_answer(answer: Answer) -> str:
     """Format an Answer for display."""
     lines = [
@@ -9,87 +9,170 @@ Key concepts:
 """
 
 from dataclasses import dataclass
+from typing import Iterator
 
-from embeddings import get_chroma_collection
+import numpy as np
 
+from embeddings import embed_texts, get_chroma_collection
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """A retrieved chunk with metadata for citations."""
     text: str
     title: str
     url: str
     source: str
-    distance: float  # Lower = more similar
+    distance: float  # Cosine distance, 0-2. Lower = more similar
+    chunk_id: str
 
     @property
     def relevance_score(self) -> float:
         """Convert distance to 0-1 relevance score (higher = better)."""
-        # ChromaDB uses L2 distance by default; this gives intuitive scores
-        return max(0, 1 - self.distance)
+        # Cosine distance is 1 - cosine similarity; clamp away the
+        # negative similarities (opposite direction = irrelevant)
+        return min(1.0, max(0.0, 1 - self.distance))
+
+
+@dataclass(slots=True, frozen=True)
+class SearchResults:
+    """
+    Search hits stored column-wise (one list/array per field).
+
+    Distances live in a NumPy array so relevance filtering is a single
+    vector comparison instead of a Python loop over result objects.
+    Indexing or iterating yields SearchResult views, so callers can
+    treat this like a list of SearchResult.
+    """
+    texts: list[str]
+    metadatas: list[dict]
+    distances: np.ndarray  # Cosine distance, 0-2. Lower = more similar
+    ids: list[str]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i: int) -> SearchResult:
+        return self.view(i)
 
+    def __iter__(self) -> Iterator[SearchResult]:
+        return (self.view(i) for i in range(len(self)))
 
-def search(query: str, top_k: int = 5) -> list[SearchResult]:
+    def view(self, i: int) -> SearchResult:
+        """Build the SearchResult for row i."""
+        meta = self.metadatas[i]
+        return SearchResult(
+            text=self.texts[i],
+            title=meta.get("title", "Unknown"),
+            url=meta.get("url", ""),
+            source=meta.get("source", "Unknown"),
+            distance=float(self.distances[i]),
+            chunk_id=self.ids[i],
+        )
+
+    @property
+    def relevance_scores(self) -> np.ndarray:
+        """SearchResult.relevance_score for every row at once."""
+        return np.clip(1 - self.distances, 0.0, 1.0)
+
+    def filter(self, min_relevance: float) -> "SearchResults":
+        """Keep rows with relevance_score >= min_relevance."""
+        keep = np.flatnonzero(self.relevance_scores >= min_relevance)
+        return SearchResults(
+            texts=[self.texts[i] for i in keep],
+            metadatas=[self.metadatas[i] for i in keep],
+            distances=self.distances[keep],
+            ids=[self.ids[i] for i in keep],
+        )
+
+
+def search(
+    query: str,
+    top_k: int = 5,
+    query_embedding: list[float] | None = None,
+) -> SearchResults:
     """
     Search for chunks relevant to a query.
 
     How it works:
-    1. ChromaDB embeds your query using the same model as documents
+    1. Embed the query using the same model as documents
     2. Finds the top_k closest document vectors (cosine similarity)
     3. Returns chunks with metadata for citations
 
     Args:
         query: Natural language question or search terms
         top_k: Number of results to return (default 5)
+        query_embedding: The query's embedding, if the caller already has it
+
+    Returns:
+        SearchResults (iterates as SearchResult objects), sorted by relevance
+    """
+    query_embeddings = None if query_embedding is None else [query_embedding]
+    return search_many([query], top_k=top_k, query_embeddings=query_embeddings)[0]
+
+
+def search_many(
+    queries: list[str],
+    top_k: int = 5,
+    query_embeddings: list[list[float]] | None = None,
+) -> list[SearchResults]:
+    """
+    Search for several queries in one ChromaDB call.
+
+    The queries are embedded in one batch (unless query_embeddings are
+    given) and the index is searched for all of them at once, which is
+    cheaper than one search() per query when requests arrive together.
+    Queries are one-off text, so they bypass the embedding cache.
 
     Returns:
-        List of SearchResult objects, sorted by relevance
+        One SearchResults per query, in the same order
     """
+    if not queries:
+        return []
+
     collection = get_chroma_collection()
 
-    # ChromaDB handles query embedding automatically
+    if query_embeddings is None:
+        query_embeddings = embed_texts(queries, cache=False)
+
     results = collection.query(
-        query_texts=[query],
+        query_embeddings=query_embeddings,
         n_results=top_k,
         include=["documents", "metadatas", "distances"],
     )
 
-    # Parse results into SearchResult objects
-    search_results = []
-
     # Results come back as lists of lists (one per query)
-    documents = results["documents"][0]
-    metadatas = results["metadatas"][0]
-    distances = results["distances"][0]
-
-    for doc, meta, dist in zip(documents, metadatas, distances):
-        search_results.append(SearchResult(
-            text=doc,
-            title=meta.get("title", "Unknown"),
-            url=meta.get("url", ""),
-            source=meta.get("source", "Unknown"),
-            distance=dist,
-        ))
-
-    return search_results
+    return [
+        SearchResults(
+            texts=texts,
+            metadatas=metadatas,
+            distances=np.asarray(distances, dtype=np.float64),
+            ids=ids,
+        )
+        for texts, metadatas, distances, ids in zip(
+            results["documents"],
+            results["metadatas"],
+            results["distances"],
+            results["ids"],
+        )
+    ]
 
 
 def search_with_threshold(
     query: str,
     top_k: int = 5,
     min_relevance: float = 0.3
-) -> list[SearchResult]:
+) -> SearchResults:
     """
     Search with a minimum relevance threshold.
 
     Useful for filtering out low-quality matches. If no results
-    meet the threshold, returns empty list rather than bad matches.
+    meet the threshold, returns empty results rather than bad matches.
     """
-    results = search(query, top_k=top_k)
-    return [r for r in results if r.relevance_score >= min_relevance]
+    return search(query, top_k=top_k).filter(min_relevance)
 
 
-def format_results(results: list[SearchResult]) -> str:
+def format_results(results: SearchResults) -> str:
     """Format search results for display."""
     if not results:
         return "No relevant results found."
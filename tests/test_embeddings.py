@@ -0,0 +1,34 @@
+"""Regression checks for token-based chunking."""
+
+import pytest
+import tiktoken
+
+import embeddings
+
+
+@pytest.fixture
+def byte_tokenizer(monkeypatch):
+    """A one-token-per-byte encoding with a special token, so no BPE download is needed."""
+    encoding = tiktoken.Encoding(
+        name="bytes",
+        pat_str=r"[\s\S]",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={"<|endoftext|>": 256},
+    )
+    monkeypatch.setattr(embeddings, "get_tokenizer", lambda: encoding)
+    return encoding
+
+
+def test_chunk_text_treats_special_token_strings_as_text(byte_tokenizer):
+    text = "Final score was 3-1. <|endoftext|> Next game is Sunday. " * 20
+
+    chunks = embeddings.chunk_text(text, chunk_size=256, overlap=32)
+
+    assert len(chunks) > 1
+    assert "<|endoftext|>" in chunks[0]
+
+
+def test_chunk_text_short_text_with_special_token(byte_tokenizer):
+    text = "Recap <|endoftext|> of the game."
+
+    assert embeddings.chunk_text(text) == [text]
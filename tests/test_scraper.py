@@ -0,0 +1,86 @@
+"""Regression checks for the scraper's retry and throttling logic."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+import scraper
+
+URL = "http://example.test/story"
+
+
+@pytest.fixture
+def fetch(monkeypatch):
+    """
+    Run one _fetch against a mock handler, returning (result, requests sent).
+
+    The real retry loop and HostThrottle run; backoff sleeps are zeroed
+    and the host rates scaled up so the test doesn't wait on them.
+    """
+    throttle = scraper.HostThrottle(rate=1000.0)
+    monkeypatch.setattr(scraper, "get_host_throttle", lambda: throttle)
+    monkeypatch.setattr(scraper, "backoff_delay", lambda attempt: 0.0)
+    monkeypatch.setattr(scraper, "HOST_MIN_RATE", 250.0)
+
+    def run(handler):
+        requests = []
+
+        def counting(request):
+            requests.append(request)
+            return handler(request)
+
+        monkeypatch.setattr(
+            scraper,
+            "make_client",
+            lambda: httpx.AsyncClient(transport=httpx.MockTransport(counting)),
+        )
+        result = scraper.run_blocking(scraper._fetch(URL))
+        return result, len(requests)
+
+    return run
+
+
+def test_five_consecutive_429s_give_up_cleanly(fetch):
+    result, attempts = fetch(lambda request: httpx.Response(429))
+
+    assert result is None
+    assert attempts == scraper.MAX_ATTEMPTS
+
+
+def test_retry_recovers_after_transient_503(fetch):
+    responses = iter([httpx.Response(503), httpx.Response(503)])
+
+    result, attempts = fetch(
+        lambda request: next(responses, None) or httpx.Response(200, content=b"ok")
+    )
+
+    assert result.body == b"ok"
+    assert attempts == 3
+
+
+def test_long_retry_after_gives_up_without_stalling(fetch):
+    start = time.monotonic()
+    result, attempts = fetch(
+        lambda request: httpx.Response(429, headers={"Retry-After": "3600"})
+    )
+
+    assert result is None
+    assert attempts == 1
+    assert time.monotonic() - start < 5
+
+
+def test_throttle_survives_slowing_below_one_request_per_second():
+    throttle = scraper.HostThrottle()
+    response = httpx.Response(429, headers={"Retry-After": "3600"})
+
+    async def slow_down_then_acquire():
+        for _ in range(scraper.MAX_ATTEMPTS):
+            throttle.observe(URL, response)
+        # Used to raise ValueError once max_rate dropped below 1
+        await throttle._limiters["example.test"].acquire()
+        return throttle._resume_at["example.test"] - asyncio.get_running_loop().time()
+
+    pause = asyncio.run(slow_down_then_acquire())
+    assert pause <= scraper.MAX_BACKOFF